@@ -21,18 +21,80 @@ class HeatMapEngine {
     // Acceleration thresholds for floor detection
     this.VERTICAL_THRESHOLD = 0.5; // m/s² to detect floor movement
     this.FLOOR_TRANSITION_TIME = 500; // ms to confirm floor change
+
+    // Ring buffer capacity (power of two; ~5.5h at 300ms sampling)
+    this.MAX_POINTS = 1 << 16;
     
     this.data = {
-      points: [],            // All recorded points
+      points: this.createPointBuffer(), // Recorded points (ring buffer)
       floors: {},           // Points grouped by floor
       duration: 0,
       startTime: null,
       endTime: null,
       currentFloor: 0,      // Which floor currently on
       trajectory: [],       // Path taken
+      floorStats: this.createFloorStats(), // Per-floor totals, kept up to date on transitions
+    };
+
+    this.floorChangeListeners = [];
+
+    // Bumped on floor transitions only, which is all the vertical heat map
+    // depends on; getVerticalHeatmap caches its result per version.
+    this._floorVersion = 0;
+    this._cachedVertical = null;
+    this._cachedVerticalVersion = -1;
+    this._cachedRows = null;
+    this._cachedRowsSource = null;
+  }
+
+  /**
+   * Allocate the point ring buffer
+   * Samples are stored column-wise in typed arrays instead of one object per point.
+   * `length` is the number of points held (capped at MAX_POINTS, oldest overwritten),
+   * `total` is the number of points ever recorded.
+   */
+  createPointBuffer() {
+    return {
+      xs: new Float32Array(this.MAX_POINTS),
+      ys: new Float32Array(this.MAX_POINTS),
+      zs: new Float32Array(this.MAX_POINTS),
+      ts: new Float64Array(this.MAX_POINTS),
+      head: 0,
+      length: 0,
+      total: 0,
     };
   }
 
+  /**
+   * Subscribe to floor transitions
+   * Lets the UI react to the (rare) floor changes without polling every sample
+   *
+   * @param {Function} listener - Called with { floor, timestamp }
+   * @returns {Function} Unsubscribe
+   */
+  onFloorChange(listener) {
+    this.floorChangeListeners.push(listener);
+    return () => {
+      this.floorChangeListeners = this.floorChangeListeners.filter(l => l !== listener);
+    };
+  }
+
+  /**
+   * Allocate per-floor visit totals (index = floor number)
+   * A visit's duration is added when the next floor change closes it.
+   */
+  createFloorStats() {
+    const durations = [];
+    const visits = [];
+    const lastVisit = [];
+    for (let i = 0; i <= 12; i++) {
+      durations.push(0);
+      visits.push(0);
+      lastVisit.push(null);
+    }
+    return { durations, visits, lastVisit };
+  }
+
   /**
    * Add raw accelerometer data point
    * @param {number} x - X acceleration (horizontal)
@@ -41,29 +103,78 @@ class HeatMapEngine {
    * @param {number} timestamp - Time of measurement
    */
   addPoint(x, y, z, timestamp) {
-    const point = {
-      x: x || 0,
-      y: y || 0,
-      z: z || 0,
-      timestamp,
-      magnitude: Math.sqrt(x*x + y*y + z*z),
-    };
+    const points = this.data.points;
+    const i = points.head;
+    points.xs[i] = x || 0;
+    points.ys[i] = y || 0;
+    points.zs[i] = z || 0;
+    points.ts[i] = timestamp;
+    points.head = (i + 1) & (this.MAX_POINTS - 1);
+    if (points.length < this.MAX_POINTS) points.length++;
+    points.total++;
+
+    this.updateFloor(z, timestamp);
+  }
+
+  /**
+   * Add a batch of raw accelerometer samples
+   * Equivalent to calling addPoint for each sample, in one tight loop
+   *
+   * @param {Float32Array} xyz - Interleaved x, y, z accelerations
+   * @param {Float64Array} timestamps - Time of each measurement
+   * @param {number} count - Number of samples in the batch
+   */
+  addBatch(xyz, timestamps, count) {
+    if (count === 0) return;
+
+    const points = this.data.points;
+    const { xs, ys, zs, ts } = points;
+    const mask = this.MAX_POINTS - 1;
+    let head = points.head;
+
+    for (let k = 0; k < count; k++) {
+      const z = xyz[k * 3 + 2] || 0;
+      xs[head] = xyz[k * 3] || 0;
+      ys[head] = xyz[k * 3 + 1] || 0;
+      zs[head] = z;
+      ts[head] = timestamps[k];
+      head = (head + 1) & mask;
+      this.updateFloor(z, timestamps[k]);
+    }
 
-    this.data.points.push(point);
+    points.head = head;
+    points.length = Math.min(points.length + count, this.MAX_POINTS);
+    points.total += count;
+  }
 
-    // Detect floor change based on Z-acceleration
+  /**
+   * Detect floor change based on Z-acceleration and record it in the trajectory
+   */
+  updateFloor(z, timestamp) {
     const detectedFloor = this.detectFloor(z);
     
     if (detectedFloor !== this.data.currentFloor) {
+      const { trajectory, floorStats } = this.data;
+
+      // Close the previous visit
+      const previous = trajectory[trajectory.length - 1];
+      if (previous && floorStats.durations[previous.floor] !== undefined) {
+        floorStats.durations[previous.floor] += (timestamp - previous.timestamp) / 1000; // seconds
+      }
+      if (floorStats.visits[detectedFloor] !== undefined) {
+        floorStats.visits[detectedFloor]++;
+        floorStats.lastVisit[detectedFloor] = timestamp;
+      }
+
       this.data.currentFloor = detectedFloor;
-      this.data.trajectory.push({
+      trajectory.push({
         floor: detectedFloor,
         timestamp,
         duration: 0,
       });
+      this._floorVersion++;
+      this.floorChangeListeners.forEach(listener => listener({ floor: detectedFloor, timestamp }));
     }
-
-    return point;
   }
 
   /**
@@ -102,24 +213,93 @@ class HeatMapEngine {
    * @returns {Array} Points with normalized (x, y) positions
    */
   getFloorHeatmap(floor) {
-    const floorPoints = this.data.points.filter(p => {
-      const detectedFloor = this.detectFloor(p.z);
-      return detectedFloor === floor;
-    });
+    const { xs, ys, zs, head, length } = this.data.points;
+    const mask = this.MAX_POINTS - 1;
+    const start = (head - length) & mask;
 
-    if (floorPoints.length === 0) return [];
+    // Collect buffer indices on this floor and the max horizontal acceleration
+    const indices = [];
+    let maxAccel = 0;
+    for (let n = 0; n < length; n++) {
+      const i = (start + n) & mask;
+      if (this.detectFloor(zs[i]) !== floor) continue;
+      indices.push(i);
+      const ax = Math.abs(xs[i]);
+      const ay = Math.abs(ys[i]);
+      if (ax > maxAccel) maxAccel = ax;
+      if (ay > maxAccel) maxAccel = ay;
+    }
 
-    // Normalize to car dimensions (1.5m x 1.5m)
-    const maxAccel = Math.max(...floorPoints.map(p => Math.max(Math.abs(p.x), Math.abs(p.y))));
-    
-    return floorPoints.map(p => ({
-      ...p,
-      // Normalize to 0-1.5m range (car size)
-      normalizedX: (p.x / maxAccel) * (this.CAR_WIDTH / 2) + (this.CAR_WIDTH / 2),
-      normalizedY: (p.y / maxAccel) * (this.CAR_DEPTH / 2) + (this.CAR_DEPTH / 2),
-      // Intensity = time spent at this point
-      intensity: Math.min(p.magnitude / 2, 1), // 0-1
-    }));
+    return this.normalizeFloorPoints(indices, maxAccel);
+  }
+
+  /**
+   * Get horizontal heat maps for every floor in a single pass over the points
+   * Same result as calling getFloorHeatmap for each floor
+   *
+   * @returns {Object} Floor number -> points with normalized (x, y) positions
+   */
+  getAllFloorHeatmaps() {
+    const { xs, ys, zs, head, length } = this.data.points;
+    const mask = this.MAX_POINTS - 1;
+    const start = (head - length) & mask;
+
+    // Bucket buffer indices by floor, tracking each floor's max horizontal acceleration
+    const indices = [];
+    const maxAccel = [];
+    for (let floor = 0; floor <= 12; floor++) {
+      indices.push([]);
+      maxAccel.push(0);
+    }
+
+    for (let n = 0; n < length; n++) {
+      const i = (start + n) & mask;
+      const floor = this.detectFloor(zs[i]);
+      const bucket = indices[floor];
+      if (!bucket) continue;
+      bucket.push(i);
+      const ax = Math.abs(xs[i]);
+      const ay = Math.abs(ys[i]);
+      if (ax > maxAccel[floor]) maxAccel[floor] = ax;
+      if (ay > maxAccel[floor]) maxAccel[floor] = ay;
+    }
+
+    const heatmaps = {};
+    for (let floor = 0; floor <= 12; floor++) {
+      heatmaps[floor] = this.normalizeFloorPoints(indices[floor], maxAccel[floor]);
+    }
+    return heatmaps;
+  }
+
+  /**
+   * Build heat map points for the given buffer indices
+   * Normalizes to car dimensions (1.5m x 1.5m)
+   */
+  normalizeFloorPoints(indices, maxAccel) {
+    if (indices.length === 0) return [];
+
+    const { xs, ys, zs, ts } = this.data.points;
+    const result = new Array(indices.length);
+    for (let n = 0; n < indices.length; n++) {
+      const i = indices[n];
+      const x = xs[i];
+      const y = ys[i];
+      const z = zs[i];
+      const magnitude = Math.sqrt(x*x + y*y + z*z);
+      result[n] = {
+        x,
+        y,
+        z,
+        timestamp: ts[i],
+        magnitude,
+        // Normalize to 0-1.5m range (car size)
+        normalizedX: (x / maxAccel) * (this.CAR_WIDTH / 2) + (this.CAR_WIDTH / 2),
+        normalizedY: (y / maxAccel) * (this.CAR_DEPTH / 2) + (this.CAR_DEPTH / 2),
+        // Intensity = time spent at this point
+        intensity: Math.min(magnitude / 2, 1), // 0-1
+      };
+    }
+    return result;
   }
 
   /**
@@ -129,36 +309,54 @@ class HeatMapEngine {
    * @returns {Object} Floor visit data
    */
   getVerticalHeatmap() {
-    const floorVisits = {};
+    if (this._cachedVerticalVersion === this._floorVersion) {
+      return this._cachedVertical;
+    }
 
-    // Initialize all floors
+    // Visits and durations are accumulated in updateFloor; just package them
+    const { durations, visits, lastVisit } = this.data.floorStats;
+    const floorVisits = {};
     for (let i = 0; i <= 12; i++) {
       floorVisits[i] = {
         floor: i,
         floorName: this.getFloorName(i),
-        duration: 0,
-        visits: 0,
-        lastVisit: null,
+        duration: durations[i],
+        visits: visits[i],
+        lastVisit: lastVisit[i],
       };
     }
 
-    // Count visits and duration per floor
-    this.data.trajectory.forEach((visit, index) => {
-      if (floorVisits[visit.floor]) {
-        floorVisits[visit.floor].visits++;
-        floorVisits[visit.floor].lastVisit = visit.timestamp;
-
-        // Calculate duration until next floor change
-        if (index < this.data.trajectory.length - 1) {
-          const nextVisit = this.data.trajectory[index + 1];
-          floorVisits[visit.floor].duration += (nextVisit.timestamp - visit.timestamp) / 1000; // seconds
-        }
-      }
-    });
-
+    this._cachedVertical = floorVisits;
+    this._cachedVerticalVersion = this._floorVersion;
     return floorVisits;
   }
 
+  /**
+   * Get vertical heat map as display rows, top floor first
+   * Same reference is returned until the vertical heat map changes
+   *
+   * @returns {Array} [{ floorNum, floorName, duration }]
+   */
+  getFloorRows() {
+    const floorVisits = this.getVerticalHeatmap();
+    if (this._cachedRowsSource === floorVisits) {
+      return this._cachedRows;
+    }
+
+    const rows = [];
+    for (let i = 12; i >= 0; i--) {
+      rows.push({
+        floorNum: i,
+        floorName: floorVisits[i].floorName,
+        duration: floorVisits[i].duration,
+      });
+    }
+
+    this._cachedRows = rows;
+    this._cachedRowsSource = floorVisits;
+    return rows;
+  }
+
   /**
    * Get human-readable floor name
    * 0 = Car Top (machine room entry)
@@ -212,7 +410,7 @@ class HeatMapEngine {
    */
   getSummary() {
     return {
-      totalPoints: this.data.points.length,
+      totalPoints: this.data.points.total,
       totalFloors: this.data.trajectory.length,
       startFloor: this.data.trajectory[0]?.floor || 0,
       endFloor: this.data.trajectory[this.data.trajectory.length - 1]?.floor || 0,
@@ -225,15 +423,23 @@ class HeatMapEngine {
    * Reset for new session
    */
   reset() {
+    // Reuse the typed arrays; only the ring indices need clearing
+    const points = this.data.points;
+    points.head = 0;
+    points.length = 0;
+    points.total = 0;
+
     this.data = {
-      points: [],
+      points,
       floors: {},
       duration: 0,
       startTime: null,
       endTime: null,
       currentFloor: 0,
       trajectory: [],
+      floorStats: this.createFloorStats(),
     };
+    this._floorVersion++;
   }
 }
 
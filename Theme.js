@@ -71,7 +71,8 @@ export const TYPOGRAPHY = {
   mono: { fontSize: 12, fontWeight: '500', lineHeight: 16 },
 };
 
-export const SPACING = {
+// Layout scales are fixed numeric tables; frozen so their shape never changes
+export const SPACING = Object.freeze({
   xs: 4,
   sm: 8,
   md: 12,
@@ -79,15 +80,15 @@ export const SPACING = {
   xl: 24,
   xxl: 32,
   xxxl: 48,
-};
+});
 
-export const RADIUS = {
+export const RADIUS = Object.freeze({
   sm: 4,
   md: 6,
   lg: 8,
   xl: 12,
   xxl: 16,
-};
+});
 
 export const SHADOWS = {
   none: {},
@@ -114,11 +115,11 @@ export const SHADOWS = {
   },
 };
 
-export const BORDERS = {
+export const BORDERS = Object.freeze({
   thin: 0.5,
   regular: 1,
   thick: 2,
-};
+});
 
 export default {
   COLORS,
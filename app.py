@@ -10,14 +10,16 @@
  * - Persistent storage (Supabase)
  */
 
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useEffect, useRef, useMemo, useCallback } from 'react';
 import {
   View,
   Text,
   TextInput,
   TouchableOpacity,
+  Pressable,
   StyleSheet,
   ScrollView,
+  FlatList,
   Alert,
   Dimensions,
   ActivityIndicator,
@@ -25,13 +27,38 @@ import {
   SafeAreaView,
   StatusBar,
   Modal,
+  InteractionManager,
 } from 'react-native';
 import { Accelerometer } from 'expo-sensors';
+import Svg, { Circle } from 'react-native-svg';
 import { COLORS, TYPOGRAPHY, SPACING, RADIUS, SHADOWS } from './01_THEME';
 import HeatMapEngine from './02_HEATMAP_ENGINE';
 
 const { width, height } = Dimensions.get('window');
 
+// How often the recording screen pulls a snapshot from the engine (ms)
+const UI_REFRESH_INTERVAL = 500;
+
+// Admin session card height incl. margin: padding + three text lines.
+// Exact because the card text and the view arrow both ignore font scaling
+// and each text line is capped at one line (see SessionCard); the unscaled
+// arrow is shorter than the text block, so it never sets the height
+const SESSION_ROW_HEIGHT =
+  SPACING.lg * 2 + 18 + (SPACING.xs + TYPOGRAPHY.caption.lineHeight) * 2 + SPACING.md;
+
+// How long list updates are held back while the user is scrolling (ms)
+const SCROLL_RENDER_DELAY = 300;
+
+// Max accelerometer samples buffered between engine ingests
+const SAMPLE_BATCH_SIZE = 64;
+
+// Horizontal heat map car outline (px)
+const CAR_WIDTH = 150;
+const CAR_DEPTH = 150;
+
+// Horizontal heat map resolution (cells per side)
+const HEAT_GRID = 20;
+
 // ====================================================================
 // STATE MANAGEMENT
 // ====================================================================
@@ -45,7 +72,31 @@ export default function App() {
   ]);
   const [currentSession, setCurrentSession] = useState(null);
   const [sessions, setSessions] = useState([]);
-  const heatmapEngine = useRef(new HeatMapEngine());
+  // Lazily created so re-renders don't construct (and discard) an engine each time
+  const heatmapEngine = useRef(null);
+  if (heatmapEngine.current === null) {
+    heatmapEngine.current = new HeatMapEngine();
+  }
+
+  // Sessions pushed in the same tick are committed as one state update
+  // (newest first), so a burst of completions costs a single list render.
+  const pendingSessions = useRef([]);
+  const pushSession = useCallback((session) => {
+    const pending = pendingSessions.current;
+    pending.push(session);
+    if (pending.length > 1) return; // flush already scheduled
+
+    queueMicrotask(() => {
+      const batch = pending.splice(0).reverse();
+      setSessions((prev) => batch.concat(prev));
+    });
+  }, []);
+
+  // Stable so memoized session rows don't re-render when App does
+  const handleViewSession = useCallback((session) => {
+    setCurrentSession(session);
+    setAppState('sessionAnalysis');
+  }, []);
 
   return (
     <SafeAreaView style={styles.mainContainer}>
@@ -93,7 +144,8 @@ export default function App() {
               status: 'completed',
               heatmapData: recordedData,
             };
-            setSessions([completedSession, ...sessions]);
+            completedSession.display = formatSessionDisplay(completedSession);
+            pushSession(completedSession);
             setCurrentSession(null);
             setAppState('technicianDashboard');
             Alert.alert('Success', 'Maintenance session recorded successfully');
@@ -106,10 +158,7 @@ export default function App() {
           user={user}
           sessions={sessions}
           elevators={elevators}
-          onViewSession={(session) => {
-            setCurrentSession(session);
-            setAppState('sessionAnalysis');
-          }}
+          onViewSession={handleViewSession}
           onLogout={() => {
             setUser(null);
             setAppState('login');
@@ -189,7 +238,7 @@ function LoginScreen({ onLogin }) {
         />
 
         <TouchableOpacity
-          style={[styles.loginButton, loading && { opacity: 0.6 }]}
+          style={loading ? LOGIN_BUTTON_LOADING_STYLE : styles.loginButton}
           onPress={handleLogin}
           disabled={loading}
         >
@@ -239,9 +288,9 @@ function TechnicianDashboard({ user, elevators, onStartSession, onLogout }) {
               <View>
                 <Text style={styles.elevatorName}>{elevator.code}</Text>
                 <Text style={styles.elevatorDesc}>{elevator.name}</Text>
-                <Text style={styles.elevatorLocation}>{elevator.location}</Text>
+                <Text style={styles.mutedCaption}>{elevator.location}</Text>
               </View>
-              <View style={[styles.statusBadge, { backgroundColor: elevator.status === 'active' ? COLORS.success : COLORS.warning }]}>
+              <View style={elevator.status === 'active' ? STATUS_BADGE_ACTIVE_STYLE : STATUS_BADGE_WARNING_STYLE}>
                 <Text style={styles.statusText}>{elevator.status}</Text>
               </View>
             </View>
@@ -263,55 +312,116 @@ function TechnicianDashboard({ user, elevators, onStartSession, onLogout }) {
 // ====================================================================
 function RecordingScreen({ session, heatmapEngine, onFinish }) {
   const [recording, setRecording] = useState(false);
-  const [duration, setDuration] = useState(0);
-  const [currentFloor, setCurrentFloor] = useState(0);
-  const [points, setPoints] = useState([]);
-  const timerRef = useRef(null);
+  const [processing, setProcessing] = useState(false);
+  // Recorded data lives in the engine; this counter only signals a re-render
+  const [, setTick] = useState(0);
+  const flushSamplesRef = useRef(null);
 
   useEffect(() => {
     if (recording) {
+      // Sensor listener only feeds the engine; UI state is refreshed
+      // separately so React renders are decoupled from the sample rate.
+      // Samples are buffered here and ingested by the engine in batches.
       Accelerometer.setUpdateInterval(300);
-      const subscription = Accelerometer.addListener(({ x, y, z }) => {
-        const point = heatmapEngine.addPoint(x, y, z, Date.now());
-        setCurrentFloor(heatmapEngine.data.currentFloor);
-        setPoints([...heatmapEngine.data.points]);
+      const sampleXyz = new Float32Array(SAMPLE_BATCH_SIZE * 3);
+      const sampleTimes = new Float64Array(SAMPLE_BATCH_SIZE);
+      let sampleCount = 0;
+      const flushSamples = () => {
+        heatmapEngine.addBatch(sampleXyz, sampleTimes, sampleCount);
+        sampleCount = 0;
+      };
+      flushSamplesRef.current = flushSamples;
+
+      // Expo reports a monotonic sensor timestamp in seconds. It is anchored to
+      // the wall clock once so samples keep epoch-ms times without Date.now().
+      let clockOffset = null;
+
+      const subscription = Accelerometer.addListener(({ x, y, z, timestamp }) => {
+        let time;
+        if (timestamp === undefined) {
+          time = Date.now();
+        } else {
+          if (clockOffset === null) clockOffset = Date.now() - timestamp * 1000;
+          time = clockOffset + timestamp * 1000;
+        }
+
+        sampleXyz[sampleCount * 3] = x;
+        sampleXyz[sampleCount * 3 + 1] = y;
+        sampleXyz[sampleCount * 3 + 2] = z;
+        sampleTimes[sampleCount] = time;
+        sampleCount++;
+        if (sampleCount === SAMPLE_BATCH_SIZE) flushSamples();
       });
 
-      timerRef.current = setInterval(() => {
-        setDuration((prev) => prev + 1);
-      }, 1000);
+      // Every update source goes through one animation frame, so at most
+      // one render happens per frame however many of them fire together.
+      let frameId = null;
+      const scheduleRender = () => {
+        if (frameId !== null) return;
+        frameId = requestAnimationFrame(() => {
+          frameId = null;
+          setTick((t) => t + 1);
+        });
+      };
+
+      // Floor transitions are coarse events; show them immediately
+      const unsubscribeFloor = heatmapEngine.onFloorChange(scheduleRender);
+
+      let renderedLen = heatmapEngine.data.points.total;
+      const uiRef = setInterval(() => {
+        flushSamples();
+        const len = heatmapEngine.data.points.total;
+        if (len === renderedLen) return;
+        renderedLen = len;
+        scheduleRender();
+      }, UI_REFRESH_INTERVAL);
 
       return () => {
         if (subscription) subscription.remove();
-        if (timerRef.current) clearInterval(timerRef.current);
+        flushSamplesRef.current = null;
+        unsubscribeFloor();
+        clearInterval(uiRef);
+        if (frameId !== null) cancelAnimationFrame(frameId);
       };
     }
   }, [recording]);
 
-  const handleStart = () => {
+  // Stable handlers let the memoized controls skip data-driven re-renders
+  const handleStart = useCallback(() => {
     setRecording(true);
-    setDuration(0);
     heatmapEngine.reset();
-  };
+    setTick((t) => t + 1);
+  }, [heatmapEngine]);
 
-  const handleStop = () => {
+  const handleStop = useCallback(() => {
     setRecording(false);
-    if (timerRef.current) clearInterval(timerRef.current);
-
-    const analysis = heatmapEngine.getWorkflowAnalysis();
-    const heatmapData = {
-      vertical: heatmapEngine.getVerticalHeatmap(),
-      horizontal: Object.fromEntries(
-        Object.entries(heatmapEngine.getVerticalHeatmap())
-          .map(([floor, data]) => [floor, heatmapEngine.getFloorHeatmap(parseInt(floor))])
-      ),
-      summary: heatmapEngine.getSummary(),
-      analysis,
-      path: heatmapEngine.getPath(),
-    };
-
-    onFinish(heatmapData);
-  };
+    if (flushSamplesRef.current) flushSamplesRef.current();
+    setProcessing(true);
+  }, []);
+
+  // Heavy aggregation runs once the stop feedback has rendered
+  useEffect(() => {
+    if (!processing) return;
+
+    const task = InteractionManager.runAfterInteractions(() => {
+      const analysis = heatmapEngine.getWorkflowAnalysis();
+      const vertical = heatmapEngine.getVerticalHeatmap();
+      const heatmapData = {
+        vertical,
+        floorRows: heatmapEngine.getFloorRows(),
+        horizontal: heatmapEngine.getAllFloorHeatmaps(),
+        summary: heatmapEngine.getSummary(),
+        analysis,
+        path: heatmapEngine.getPath(),
+      };
+
+      onFinish(heatmapData);
+    });
+
+    return () => task.cancel();
+  }, [processing]);
+
+  const currentFloor = heatmapEngine.data.currentFloor;
 
   return (
     <View style={styles.container}>
@@ -322,78 +432,125 @@ function RecordingScreen({ session, heatmapEngine, onFinish }) {
 
       <ScrollView style={styles.content}>
         {/* Recording Status */}
-        <View style={[styles.statusCard, recording && styles.recordingActive]}>
+        <View style={recording ? STATUS_CARD_RECORDING_STYLE : styles.statusCard}>
           <Text style={styles.statusIcon}>{recording ? '🔴' : '⏹️'}</Text>
           <Text style={styles.statusText}>{recording ? 'RECORDING' : 'Ready to record'}</Text>
-          <Text style={styles.timer}>{formatTime(duration)}</Text>
+          <Timer recording={recording} />
           <Text style={styles.floorDisplay}>Floor: {currentFloor}</Text>
-          <Text style={styles.pointsDisplay}>Points: {points.length}</Text>
+          <Text style={styles.pointsDisplay}>Points: {heatmapEngine.data.points.total}</Text>
         </View>
 
         {/* Real-time Vertical Heat Map */}
         <Text style={styles.chartTitle}>Floors Visited</Text>
         <VerticalHeatmap
-          floors={heatmapEngine.getVerticalHeatmap()}
+          floors={heatmapEngine.getFloorRows()}
           currentFloor={currentFloor}
         />
 
         {/* Instructions */}
-        <View style={styles.instructions}>
-          <Text style={styles.instructionsTitle}>📋 Instructions:</Text>
-          <Text style={styles.instructionText}>1. Start recording</Text>
-          <Text style={styles.instructionText}>2. Navigate elevator shaft (3m = 1 floor)</Text>
-          <Text style={styles.instructionText}>3. Stop when finished</Text>
-        </View>
+        <InstructionsPanel />
       </ScrollView>
 
       {/* Controls */}
-      <View style={styles.controls}>
-        {!recording ? (
-          <TouchableOpacity style={[styles.button, styles.startButton]} onPress={handleStart}>
-            <Text style={styles.buttonText}>▶️ START</Text>
-          </TouchableOpacity>
-        ) : (
-          <TouchableOpacity style={[styles.button, styles.stopButton]} onPress={handleStop}>
-            <Text style={styles.buttonText}>⏹️ STOP</Text>
-          </TouchableOpacity>
-        )}
-      </View>
+      <RecordingControls
+        recording={recording}
+        processing={processing}
+        onStart={handleStart}
+        onStop={handleStop}
+      />
     </View>
   );
 }
 
+// ====================================================================
+// INSTRUCTIONS PANEL
+// Static content; memoized so recording updates never re-render it
+// ====================================================================
+const InstructionsPanel = React.memo(function InstructionsPanel() {
+  // One text node; line spacing comes from lineHeight
+  return (
+    <View style={styles.instructions}>
+      <Text>
+        <Text style={styles.instructionsTitle}>📋 Instructions:{'\n'}</Text>
+        <Text style={styles.instructionText}>
+          1. Start recording{'\n'}
+          2. Navigate elevator shaft (3m = 1 floor){'\n'}
+          3. Stop when finished
+        </Text>
+      </Text>
+    </View>
+  );
+});
+
+// ====================================================================
+// RECORDING CONTROLS
+// Only re-renders when the recording/processing state changes
+// ====================================================================
+const RecordingControls = React.memo(function RecordingControls({ recording, processing, onStart, onStop }) {
+  return (
+    <View style={styles.controls}>
+      {processing ? (
+        <View style={BUTTON_STYLES.start}>
+          <ActivityIndicator color="white" size="small" />
+        </View>
+      ) : !recording ? (
+        <TouchableOpacity style={BUTTON_STYLES.start} onPress={onStart}>
+          <Text style={styles.buttonText}>▶️ START</Text>
+        </TouchableOpacity>
+      ) : (
+        <TouchableOpacity style={BUTTON_STYLES.stop} onPress={onStop}>
+          <Text style={styles.buttonText}>⏹️ STOP</Text>
+        </TouchableOpacity>
+      )}
+    </View>
+  );
+});
+
+// ====================================================================
+// RECORDING TIMER
+// Owns the 1 Hz counter so only this Text re-renders every second
+// ====================================================================
+function Timer({ recording }) {
+  const [seconds, setSeconds] = useState(0);
+
+  useEffect(() => {
+    if (!recording) return;
+    setSeconds(0);
+    const id = setInterval(() => {
+      setSeconds((prev) => prev + 1);
+    }, 1000);
+    return () => clearInterval(id);
+  }, [recording]);
+
+  return <Text style={styles.timer}>{formatTime(seconds)}</Text>;
+}
+
 // ====================================================================
 // VERTICAL HEAT MAP COMPONENT
 // ====================================================================
-function VerticalHeatmap({ floors, currentFloor }) {
+const VerticalHeatmap = React.memo(function VerticalHeatmap({ floors, currentFloor }) {
   return (
     <View style={styles.heatmapContainer}>
-      {Object.entries(floors)
-        .reverse()
-        .map(([floorNum, data]) => (
-          <View
-            key={floorNum}
-            style={[
-              styles.floorBar,
-              parseInt(floorNum) === currentFloor && styles.floorBarActive,
-            ]}
-          >
-            <Text style={styles.floorLabel}>{data.floorName}</Text>
-            <View style={styles.barBackground}>
-              <View
-                style={[
-                  styles.barFill,
-                  { width: `${Math.min((data.duration / 10) * 100, 100)}%` },
-                  parseInt(floorNum) === currentFloor && styles.barFillActive,
-                ]}
-              />
-            </View>
-            <Text style={styles.floorDuration}>{Math.round(data.duration)}s</Text>
+      {floors.map((row) => (
+        <View
+          key={row.floorNum}
+          style={row.floorNum === currentFloor ? FLOOR_BAR_ACTIVE_STYLE : styles.floorBar}
+        >
+          <Text style={styles.floorLabel}>{row.floorName}</Text>
+          <View style={styles.barBackground}>
+            <View
+              style={[
+                row.floorNum === currentFloor ? BAR_FILL_ACTIVE_STYLE : styles.barFill,
+                { width: `${Math.min((row.duration / 10) * 100, 100)}%` },
+              ]}
+            />
           </View>
-        ))}
+          <Text style={styles.floorDuration}>{Math.round(row.duration)}s</Text>
+        </View>
+      ))}
     </View>
   );
-}
+});
 
 // ====================================================================
 // SESSION ANALYSIS (ADMIN VIEW)
@@ -403,6 +560,12 @@ function SessionAnalysisScreen({ session, onBack }) {
 
   const heatmapData = session.heatmapData;
 
+  // Visited floors for the selector, bottom floor first
+  const visitedFloors = useMemo(
+    () => heatmapData.floorRows.filter((row) => row.duration > 0).reverse(),
+    [heatmapData]
+  );
+
   return (
     <View style={styles.container}>
       <View style={styles.header}>
@@ -415,76 +578,82 @@ function SessionAnalysisScreen({ session, onBack }) {
         </View>
       </View>
 
-      <ScrollView style={styles.content}>
-        {/* Summary Stats */}
-        <View style={styles.statsContainer}>
-          <View style={styles.statBox}>
-            <Text style={styles.statValue}>{heatmapData.summary.duration}s</Text>
-            <Text style={styles.statLabel}>Duration</Text>
-          </View>
-          <View style={styles.statBox}>
-            <Text style={styles.statValue}>{heatmapData.summary.floorsVisited}</Text>
-            <Text style={styles.statLabel}>Floors</Text>
-          </View>
-          <View style={styles.statBox}>
-            <Text style={styles.statValue}>{heatmapData.summary.totalPoints}</Text>
-            <Text style={styles.statLabel}>Data Points</Text>
-          </View>
-        </View>
-
-        {/* Vertical Heat Map */}
-        <Text style={styles.chartTitle}>Floor Timeline</Text>
-        <VerticalHeatmapStatic floors={heatmapData.vertical} />
-
-        {/* Floor Selection for Horizontal Heat Map */}
-        <Text style={styles.chartTitle}>Floor Details</Text>
-        <ScrollView horizontal style={styles.floorSelector}>
-          {Object.entries(heatmapData.vertical).map(([floorNum, data]) => (
-            data.duration > 0 && (
-              <TouchableOpacity
-                key={floorNum}
-                style={[
-                  styles.floorSelectorButton,
-                  selectedFloor === parseInt(floorNum) && styles.floorSelectorActive,
-                ]}
-                onPress={() => setSelectedFloor(parseInt(floorNum))}
-              >
-                <Text style={styles.floorSelectorText}>{data.floorName}</Text>
-              </TouchableOpacity>
-            )
-          )}
-        </ScrollView>
-
-        {/* Horizontal Heat Map for Selected Floor */}
-        {selectedFloor !== null && (
-          <HorizontalHeatmap
-            floor={selectedFloor}
-            points={heatmapData.horizontal[selectedFloor] || []}
-            floorName={heatmapData.vertical[selectedFloor]?.floorName || `Floor ${selectedFloor}`}
-          />
-        )}
-
-        {/* Workflow Path */}
-        <Text style={styles.chartTitle}>Maintenance Path</Text>
-        {heatmapData.path.map((step) => (
-          <View key={step.order} style={styles.pathStep}>
+      {/* Path steps are virtualized; the rest of the report scrolls with them */}
+      <FlatList
+        style={styles.content}
+        data={heatmapData.path}
+        keyExtractor={(step) => String(step.order)}
+        renderItem={({ item: step }) => (
+          <View style={styles.pathStep}>
             <Text style={styles.pathOrder}>{step.order}</Text>
             <View style={styles.pathInfo}>
               <Text style={styles.pathFloor}>{step.floorName}</Text>
-              <Text style={styles.pathTime}>{step.time} ({step.duration}s)</Text>
+              <Text style={styles.mutedCaption}>{step.time} ({step.duration}s)</Text>
             </View>
           </View>
-        ))}
+        )}
+        ListHeaderComponent={
+          <>
+            {/* Summary Stats */}
+            <View style={styles.statsContainer}>
+              <View style={styles.statBox}>
+                <Text style={styles.statValue}>{heatmapData.summary.duration}s</Text>
+                <Text style={styles.mutedCaption}>Duration</Text>
+              </View>
+              <View style={styles.statBox}>
+                <Text style={styles.statValue}>{heatmapData.summary.floorsVisited}</Text>
+                <Text style={styles.mutedCaption}>Floors</Text>
+              </View>
+              <View style={styles.statBox}>
+                <Text style={styles.statValue}>{heatmapData.summary.totalPoints}</Text>
+                <Text style={styles.mutedCaption}>Data Points</Text>
+              </View>
+            </View>
 
-        {/* Analysis */}
-        <Text style={styles.chartTitle}>Work Analysis</Text>
-        {heatmapData.analysis.map((floor, index) => (
-          <View key={index} style={styles.analysisItem}>
-            <Text style={styles.analysisFloor}>{floor.floorName}</Text>
-            <Text style={styles.analysisTime}>{Math.round(floor.duration)}s spent</Text>
-          </View>
-        ))}
-      </ScrollView>
+            {/* Vertical Heat Map */}
+            <Text style={styles.chartTitle}>Floor Timeline</Text>
+            <VerticalHeatmapStatic floors={heatmapData.floorRows} />
+
+            {/* Floor Selection for Horizontal Heat Map */}
+            <Text style={styles.chartTitle}>Floor Details</Text>
+            <ScrollView horizontal style={styles.floorSelector}>
+              {visitedFloors.map((row) => (
+                <TouchableOpacity
+                  key={row.floorNum}
+                  style={selectedFloor === row.floorNum ? FLOOR_SELECTOR_ACTIVE_STYLE : styles.floorSelectorButton}
+                  onPress={() => setSelectedFloor(row.floorNum)}
+                >
+                  <Text style={styles.floorSelectorText}>{row.floorName}</Text>
+                </TouchableOpacity>
+              ))}
+            </ScrollView>
+
+            {/* Horizontal Heat Map for Selected Floor */}
+            {selectedFloor !== null && (
+              <HorizontalHeatmap
+                floor={selectedFloor}
+                points={heatmapData.horizontal[selectedFloor] || []}
+                floorName={heatmapData.vertical[selectedFloor]?.floorName || `Floor ${selectedFloor}`}
+              />
+            )}
+
+            {/* Workflow Path */}
+            <Text style={styles.chartTitle}>Maintenance Path</Text>
+          </>
+        }
+        ListFooterComponent={
+          <>
+            {/* Analysis */}
+            <Text style={styles.chartTitle}>Work Analysis</Text>
+            {heatmapData.analysis.map((floor, index) => (
+              <View key={index} style={styles.analysisItem}>
+                <Text style={styles.analysisFloor}>{floor.floorName}</Text>
+                <Text style={styles.analysisTime}>{Math.round(floor.duration)}s spent</Text>
+              </View>
+            ))}
+          </>
+        }
+      />
     </View>
   );
 }
@@ -492,41 +661,74 @@ function SessionAnalysisScreen({ session, onBack }) {
 // ====================================================================
 // HORIZONTAL HEAT MAP
 // ====================================================================
-function HorizontalHeatmap({ floor, points, floorName }) {
-  const CAR_WIDTH = 150; // px
-  const CAR_DEPTH = 150; // px
+const HorizontalHeatmap = React.memo(function HorizontalHeatmap({ floor, points, floorName }) {
+  // Points are binned onto a HEAT_GRID x HEAT_GRID grid (intensity summed per
+  // cell) so the draw cost is bounded by the grid, not the session length.
+  // Output is packed [cx, cy, r, opacity] per occupied cell.
+  // Extents come from a single pass (spreading large arrays into Math.max throws).
+  const circles = useMemo(() => {
+    let maxX = 0;
+    let maxY = 0;
+    for (let i = 0; i < points.length; i++) {
+      const p = points[i];
+      if (p.normalizedX > maxX) maxX = p.normalizedX;
+      if (p.normalizedY > maxY) maxY = p.normalizedY;
+    }
 
-  const maxX = Math.max(...(points.map(p => p.normalizedX || 0) || [1]));
-  const maxY = Math.max(...(points.map(p => p.normalizedY || 0) || [1]));
+    const grid = new Float32Array(HEAT_GRID * HEAT_GRID);
+    let occupied = 0;
+    let maxHeat = 0;
+    for (let i = 0; i < points.length; i++) {
+      const p = points[i];
+      const gx = Math.min(HEAT_GRID - 1, Math.max(0, ((p.normalizedX / (maxX || 1.5)) * HEAT_GRID) | 0));
+      const gy = Math.min(HEAT_GRID - 1, Math.max(0, ((p.normalizedY / (maxY || 1.5)) * HEAT_GRID) | 0));
+      const cell = gy * HEAT_GRID + gx;
+      if (grid[cell] === 0) occupied++;
+      // Floor each sample's weight so zero-intensity points still mark their cell
+      grid[cell] += Math.max(p.intensity || 0, 0.01);
+      if (grid[cell] > maxHeat) maxHeat = grid[cell];
+    }
+
+    const cellW = (CAR_WIDTH - 20) / HEAT_GRID;
+    const cellH = (CAR_DEPTH - 20) / HEAT_GRID;
+    const packed = new Float32Array(occupied * 4);
+    let j = 0;
+    for (let cell = 0; cell < grid.length; cell++) {
+      if (grid[cell] === 0) continue;
+      const heat = grid[cell] / maxHeat;
+      const size = 8 + heat * 12;
+      packed[j++] = ((cell % HEAT_GRID) + 0.5) * cellW + 10;
+      packed[j++] = (((cell / HEAT_GRID) | 0) + 0.5) * cellH + 10;
+      packed[j++] = size / 2;
+      packed[j++] = 0.6 + heat * 0.4;
+    }
+    return packed;
+  }, [points]);
+
+  const dots = [];
+  for (let i = 0; i < circles.length; i += 4) {
+    dots.push(
+      <Circle
+        key={i}
+        cx={circles[i]}
+        cy={circles[i + 1]}
+        r={circles[i + 2]}
+        opacity={circles[i + 3]}
+        fill={COLORS.primaryAccent}
+      />
+    );
+  }
 
   return (
     <View style={styles.horizontalHeatmapContainer}>
       <Text style={styles.heatmapSubtitle}>{floorName} Heat Map</Text>
       <View style={styles.carVisualizer}>
         {/* Car boundary */}
-        <View style={[styles.carBoundary, { width: CAR_WIDTH, height: CAR_DEPTH }]}>
-          {/* Heat map points */}
-          {points.map((point, index) => {
-            const x = (point.normalizedX / (maxX || 1.5)) * (CAR_WIDTH - 20);
-            const y = (point.normalizedY / (maxY || 1.5)) * (CAR_DEPTH - 20);
-            const size = 8 + (point.intensity || 0) * 12;
-
-            return (
-              <View
-                key={index}
-                style={[
-                  styles.heatPoint,
-                  {
-                    left: x,
-                    top: y,
-                    width: size,
-                    height: size,
-                    opacity: 0.6 + (point.intensity || 0) * 0.4,
-                  },
-                ]}
-              />
-            );
-          })}
+        <View style={styles.carBoundary}>
+          {/* Heat map points, drawn into a single native SVG view */}
+          <Svg width={CAR_WIDTH} height={CAR_DEPTH}>
+            {dots}
+          </Svg>
         </View>
       </View>
       <Text style={styles.heatmapNote}>
@@ -534,7 +736,7 @@ function HorizontalHeatmap({ floor, points, floorName }) {
       </Text>
     </View>
   );
-}
+});
 
 // ====================================================================
 // ADMIN DASHBOARD
@@ -552,558 +754,750 @@ function AdminDashboard({ user, sessions, elevators, onViewSession, onLogout })
         </TouchableOpacity>
       </View>
 
-      <ScrollView style={styles.content}>
+      <View style={ADMIN_CONTENT_STYLE}>
         <Text style={styles.sectionTitle}>Recent Sessions</Text>
-        {sessions.length === 0 ? (
-          <Text style={styles.emptyText}>No sessions recorded yet</Text>
-        ) : (
-          sessions.map((session) => (
-            <TouchableOpacity
-              key={session.id}
-              style={styles.sessionCard}
-              onPress={() => onViewSession(session)}
-            >
-              <View>
-                <Text style={styles.sessionElevator}>{session.elevator.code} - {session.elevator.name}</Text>
-                <Text style={styles.sessionTime}>
-                  {session.startTime?.toLocaleString()}
-                </Text>
-                <Text style={styles.sessionStats}>
-                  Duration: {session.heatmapData?.summary?.duration || 0}s • Floors: {session.heatmapData?.summary?.floorsVisited || 0}
-                </Text>
-              </View>
-              <Text style={styles.viewArrow}>→</Text>
-            </TouchableOpacity>
-          ))
-        )}
-      </ScrollView>
+        <SessionList sessions={sessions} onViewSession={onViewSession} />
+      </View>
     </View>
   );
 }
 
+// ====================================================================
+// SESSION LIST
+// Empty state, single card or virtualized list; memoized on its props
+// ====================================================================
+const SessionList = React.memo(function SessionList({ sessions, onViewSession }) {
+  // New sessions are held back while the list is being scrolled
+  const scrollingRef = useRef(false);
+  const [visibleSessions, flushSessions] = useScrollDeferredValue(sessions, scrollingRef);
+  const handleScrollStart = useCallback(() => {
+    scrollingRef.current = true;
+  }, []);
+  const handleScrollEnd = useCallback(() => {
+    scrollingRef.current = false;
+    flushSessions();
+  }, [flushSessions]);
+
+  // Rows report their id; the lookup goes through a ref so this handler
+  // (a row prop) stays the same when the list changes
+  const sessionsRef = useRef(visibleSessions);
+  sessionsRef.current = visibleSessions;
+  const handlePressSession = useCallback((id) => {
+    const session = sessionsRef.current.find((s) => s.id === id);
+    if (session) onViewSession(session);
+  }, [onViewSession]);
+
+  const renderSession = useCallback(
+    ({ item }) => renderSessionCard(item, handlePressSession),
+    [handlePressSession]
+  );
+
+  if (visibleSessions.length === 0) return EMPTY_SESSIONS_VIEW;
+
+  // A single row doesn't need the virtualization machinery
+  if (visibleSessions.length === 1) {
+    return renderSessionCard(visibleSessions[0], handlePressSession);
+  }
+
+  return (
+    <FlatList
+      data={visibleSessions}
+      keyExtractor={sessionKeyExtractor}
+      getItemLayout={getSessionItemLayout}
+      renderItem={renderSession}
+      initialNumToRender={10}
+      maxToRenderPerBatch={10}
+      windowSize={5}
+      removeClippedSubviews
+      onScrollBeginDrag={handleScrollStart}
+      onScrollEndDrag={handleScrollEnd}
+      onMomentumScrollBegin={handleScrollStart}
+      onMomentumScrollEnd={handleScrollEnd}
+    />
+  );
+});
+
+// Session rows have a fixed height, so FlatList never has to measure them
+const sessionKeyExtractor = (session) => String(session.id);
+const getSessionItemLayout = (_, index) => ({
+  length: SESSION_ROW_HEIGHT,
+  offset: SESSION_ROW_HEIGHT * index,
+  index,
+});
+
+// ====================================================================
+// SESSION CARD
+// Memoized, so unchanged rows skip re-rendering
+// ====================================================================
+const sessionCardStyle = ({ pressed }) => (pressed ? SESSION_CARD_PRESSED_STYLE : styles.sessionCard);
+
+// Props are primitives, so the default shallow compare is enough
+const SessionCard = React.memo(function SessionCard({ id, elevator, time, stats, onPress }) {
+  return (
+    <Pressable style={sessionCardStyle} onPress={() => onPress(id)}>
+      {/* One unscaled, single-line Text per line so a long value truncates
+          without pushing the others out; the row matches SESSION_ROW_HEIGHT */}
+      <View style={styles.sessionText}>
+        <Text style={styles.sessionElevator} numberOfLines={1} allowFontScaling={false}>
+          {elevator}
+        </Text>
+        <Text style={styles.sessionCaption} numberOfLines={1} allowFontScaling={false}>
+          {time}
+        </Text>
+        <Text style={styles.sessionCaption} numberOfLines={1} allowFontScaling={false}>
+          {stats}
+        </Text>
+      </View>
+      {VIEW_ARROW}
+    </Pressable>
+  );
+});
+
+function renderSessionCard(session, onPress) {
+  const { display } = session;
+  return (
+    <SessionCard
+      id={session.id}
+      elevator={display.elevator}
+      time={display.time}
+      stats={display.stats}
+      onPress={onPress}
+    />
+  );
+}
+
 // ====================================================================
 // VERTICAL HEAT MAP (STATIC)
 // ====================================================================
-function VerticalHeatmapStatic({ floors }) {
+const VerticalHeatmapStatic = React.memo(function VerticalHeatmapStatic({ floors }) {
   return (
     <View style={styles.heatmapContainer}>
-      {Object.entries(floors)
-        .reverse()
-        .map(([floorNum, data]) => (
-          <View key={floorNum} style={styles.floorBar}>
-            <Text style={styles.floorLabel}>{data.floorName}</Text>
-            <View style={styles.barBackground}>
-              <View
-                style={[
-                  styles.barFill,
-                  { width: `${Math.min((data.duration / 10) * 100, 100)}%` },
-                ]}
-              />
-            </View>
-            <Text style={styles.floorDuration}>{Math.round(data.duration)}s</Text>
+      {floors.map((row) => (
+        <View key={row.floorNum} style={styles.floorBar}>
+          <Text style={styles.floorLabel}>{row.floorName}</Text>
+          <View style={styles.barBackground}>
+            <View
+              style={[
+                styles.barFill,
+                { width: `${Math.min((row.duration / 10) * 100, 100)}%` },
+              ]}
+            />
           </View>
-        ))}
+          <Text style={styles.floorDuration}>{Math.round(row.duration)}s</Text>
+        </View>
+      ))}
     </View>
   );
+});
+
+// ====================================================================
+// SCROLL-AWARE RENDERING
+// Returns a deferred copy of `value` and a flush callback. While idle,
+// updates are applied once pending interactions finish; while scrollingRef
+// is set they are throttled: the first change starts a timer that keeps
+// running across later changes and commits the latest value after
+// SCROLL_RENDER_DELAY ms. flush() commits the latest value immediately.
+// ====================================================================
+function useScrollDeferredValue(value, scrollingRef) {
+  const [current, setCurrent] = useState(value);
+  const latestRef = useRef(value);
+  latestRef.current = value;
+  const timerRef = useRef(null);
+
+  const flush = useCallback(() => {
+    if (timerRef.current !== null) {
+      clearTimeout(timerRef.current);
+      timerRef.current = null;
+    }
+    setCurrent(latestRef.current);
+  }, []);
+
+  useEffect(() => {
+    if (value === current) return;
+
+    if (scrollingRef.current) {
+      if (timerRef.current === null) {
+        timerRef.current = setTimeout(() => {
+          timerRef.current = null;
+          setCurrent(latestRef.current);
+        }, SCROLL_RENDER_DELAY);
+      }
+      return;
+    }
+
+    const task = InteractionManager.runAfterInteractions(() => setCurrent(latestRef.current));
+    return () => task.cancel();
+  }, [value, current]);
+
+  useEffect(() => () => clearTimeout(timerRef.current), []);
+
+  return [current, flush];
 }
 
 // ====================================================================
 // UTILITIES
 // ====================================================================
+// Session row strings, formatted once when the session is completed
+// so list renders never run the date formatter
+function formatSessionDisplay(session) {
+  const summary = session.heatmapData?.summary;
+  return {
+    elevator: `${session.elevator.code} - ${session.elevator.name}`,
+    time: session.startTime?.toLocaleString(),
+    stats: `Duration: ${summary?.duration || 0}s • Floors: ${summary?.floorsVisited || 0}`,
+  };
+}
+
+// Last formatted value; the timer asks for the same second more than once
+let lastFormattedSeconds = -1;
+let lastFormattedTime = '00:00';
+
 function formatTime(seconds) {
-  const mins = Math.floor(seconds / 60);
-  const secs = seconds % 60;
-  return `${mins.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
+  if (seconds === lastFormattedSeconds) return lastFormattedTime;
+
+  const mins = (seconds / 60) | 0;
+  const secs = seconds - mins * 60;
+  lastFormattedSeconds = seconds;
+  lastFormattedTime = (mins < 10 ? '0' : '') + mins + ':' + (secs < 10 ? '0' : '') + secs;
+  return lastFormattedTime;
 }
 
 // ====================================================================
 // STYLES
 // ====================================================================
-const styles = StyleSheet.create({
-  mainContainer: {
-    flex: 1,
-    backgroundColor: COLORS.background,
-  },
-  container: {
-    flex: 1,
-    backgroundColor: COLORS.background,
-  },
-
-  // LOGIN
-  loginContainer: {
-    flex: 1,
-    backgroundColor: COLORS.background,
-  },
-  loginHeader: {
-    paddingVertical: SPACING.xxxl,
-    alignItems: 'center',
-  },
-  logo: {
-    fontSize: 40,
-    fontWeight: '700',
-    color: COLORS.primary,
-    letterSpacing: 2,
-  },
-  appTitle: {
-    fontSize: 18,
-    fontWeight: '600',
-    color: COLORS.dark,
-    marginTop: SPACING.md,
-  },
-  appSubtitle: {
-    fontSize: 13,
-    color: COLORS.gray,
-    marginTop: SPACING.sm,
-  },
-  loginForm: {
-    paddingHorizontal: SPACING.lg,
-    paddingVertical: SPACING.lg,
-  },
-  formLabel: {
-    fontSize: TYPOGRAPHY.label.fontSize,
-    fontWeight: '600',
-    color: COLORS.dark,
-    marginBottom: SPACING.sm,
-  },
-  input: {
-    borderWidth: 1,
-    borderColor: COLORS.veryLight,
-    borderRadius: RADIUS.md,
-    paddingHorizontal: SPACING.md,
-    paddingVertical: SPACING.md,
-    fontSize: 14,
-    backgroundColor: COLORS.white,
-    marginBottom: SPACING.lg,
-  },
-  loginButton: {
-    backgroundColor: COLORS.primaryAccent,
-    paddingVertical: SPACING.md,
-    borderRadius: RADIUS.md,
-    alignItems: 'center',
-  },
-  loginButtonText: {
-    color: COLORS.white,
-    fontSize: 14,
-    fontWeight: '600',
-  },
-  testAccounts: {
-    marginTop: SPACING.xl,
-    padding: SPACING.md,
-    backgroundColor: COLORS.surface,
-    borderRadius: RADIUS.lg,
-    borderLeftWidth: 4,
-    borderLeftColor: COLORS.primaryAccent,
-  },
-  testTitle: {
-    fontSize: 12,
-    fontWeight: '700',
-    color: COLORS.dark,
-    marginBottom: SPACING.sm,
-  },
-  testAccount: {
-    fontSize: 11,
-    color: COLORS.gray,
-    marginBottom: SPACING.xs,
-  },
-
-  // HEADER
-  header: {
-    backgroundColor: COLORS.primary,
-    paddingHorizontal: SPACING.lg,
-    paddingVertical: SPACING.lg,
-    flexDirection: 'row',
-    justifyContent: 'space-between',
-    alignItems: 'center',
-  },
-  headerTitle: {
-    fontSize: 18,
-    fontWeight: '700',
-    color: COLORS.white,
-  },
-  headerSubtitle: {
-    fontSize: 12,
-    color: 'rgba(255, 255, 255, 0.7)',
-    marginTop: SPACING.xs,
-  },
-  backButton: {
-    color: COLORS.white,
-    fontSize: 14,
-    fontWeight: '600',
-  },
-  logoutButton: {
-    fontSize: 24,
-  },
-
-  // CONTENT
-  content: {
-    flex: 1,
-    paddingHorizontal: SPACING.lg,
-    paddingVertical: SPACING.lg,
-  },
-  sectionTitle: {
-    fontSize: 16,
-    fontWeight: '700',
-    color: COLORS.dark,
-    marginBottom: SPACING.md,
-  },
-  chartTitle: {
-    fontSize: 14,
-    fontWeight: '700',
-    color: COLORS.dark,
-    marginTop: SPACING.lg,
-    marginBottom: SPACING.md,
-  },
-
-  // ELEVATOR CARDS
-  elevatorCard: {
-    backgroundColor: COLORS.white,
-    borderRadius: RADIUS.lg,
-    padding: SPACING.lg,
-    marginBottom: SPACING.md,
-    borderWidth: 1,
-    borderColor: COLORS.veryLight,
-  },
-  elevatorCardContent: {
-    flexDirection: 'row',
-    justifyContent: 'space-between',
-    alignItems: 'flex-start',
-    marginBottom: SPACING.md,
-  },
-  elevatorName: {
-    fontSize: 14,
-    fontWeight: '700',
-    color: COLORS.primaryAccent,
-  },
-  elevatorDesc: {
-    fontSize: 13,
-    fontWeight: '600',
-    color: COLORS.dark,
-    marginTop: SPACING.xs,
-  },
-  elevatorLocation: {
-    fontSize: 11,
-    color: COLORS.gray,
-    marginTop: SPACING.xs,
-  },
-  statusBadge: {
-    paddingHorizontal: SPACING.md,
-    paddingVertical: SPACING.sm,
-    borderRadius: RADIUS.sm,
-  },
-  statusText: {
-    color: COLORS.white,
-    fontSize: 11,
-    fontWeight: '600',
-  },
-  startButton: {
-    backgroundColor: COLORS.primaryAccent,
-    paddingVertical: SPACING.md,
-    borderRadius: RADIUS.md,
-    alignItems: 'center',
-  },
-  startButtonText: {
-    color: COLORS.white,
-    fontSize: 13,
-    fontWeight: '600',
-  },
-
-  // RECORDING
-  statusCard: {
-    backgroundColor: COLORS.white,
-    borderRadius: RADIUS.lg,
-    padding: SPACING.xl,
-    marginBottom: SPACING.lg,
-    alignItems: 'center',
-    borderLeftWidth: 4,
-    borderLeftColor: COLORS.warning,
-  },
-  recordingActive: {
-    backgroundColor: '#fff5f0',
-    borderLeftColor: COLORS.danger,
-  },
-  statusIcon: {
-    fontSize: 48,
-    marginBottom: SPACING.md,
-  },
-  timer: {
-    fontSize: 32,
-    fontWeight: '700',
-    color: COLORS.primaryAccent,
-    marginVertical: SPACING.md,
-  },
-  floorDisplay: {
-    fontSize: 13,
-    color: COLORS.gray,
-  },
-  pointsDisplay: {
-    fontSize: 13,
-    color: COLORS.gray,
-    marginTop: SPACING.xs,
-  },
-
-  // HEAT MAPS
-  heatmapContainer: {
-    backgroundColor: COLORS.white,
-    borderRadius: RADIUS.lg,
-    overflow: 'hidden',
-    marginBottom: SPACING.lg,
-  },
-  floorBar: {
-    flexDirection: 'row',
-    alignItems: 'center',
-    paddingVertical: SPACING.md,
-    paddingHorizontal: SPACING.md,
-    borderBottomWidth: 1,
-    borderBottomColor: COLORS.veryLight,
-  },
-  floorBarActive: {
-    backgroundColor: 'rgba(46, 80, 144, 0.05)',
-  },
-  floorLabel: {
-    fontSize: 11,
-    color: COLORS.gray,
-    fontWeight: '600',
-    width: 100,
-  },
-  barBackground: {
-    flex: 1,
-    height: 24,
-    backgroundColor: COLORS.surface,
-    borderRadius: RADIUS.sm,
-    marginHorizontal: SPACING.md,
-    overflow: 'hidden',
-  },
-  barFill: {
-    height: '100%',
-    backgroundColor: COLORS.primaryAccent,
-    borderRadius: RADIUS.sm,
-  },
-  barFillActive: {
-    backgroundColor: COLORS.danger,
-  },
-  floorDuration: {
-    fontSize: 11,
-    color: COLORS.dark,
-    fontWeight: '600',
-    width: 50,
-    textAlign: 'right',
-  },
-
-  // HORIZONTAL HEAT MAP
-  horizontalHeatmapContainer: {
-    backgroundColor: COLORS.white,
-    borderRadius: RADIUS.lg,
-    padding: SPACING.lg,
-    marginBottom: SPACING.lg,
-  },
-  heatmapSubtitle: {
-    fontSize: 13,
-    fontWeight: '600',
-    color: COLORS.dark,
-    marginBottom: SPACING.md,
-  },
-  carVisualizer: {
-    alignItems: 'center',
-    marginVertical: SPACING.lg,
-  },
-  carBoundary: {
-    borderWidth: 2,
-    borderColor: COLORS.primaryAccent,
-    position: 'relative',
-    backgroundColor: COLORS.surface,
-  },
-  heatPoint: {
-    position: 'absolute',
-    borderRadius: 100,
-    backgroundColor: COLORS.primaryAccent,
-  },
-  heatmapNote: {
-    fontSize: 11,
-    color: COLORS.gray,
-    textAlign: 'center',
-  },
-
-  // FLOOR SELECTOR
-  floorSelector: {
-    marginBottom: SPACING.lg,
-  },
-  floorSelectorButton: {
-    backgroundColor: COLORS.white,
-    paddingHorizontal: SPACING.md,
-    paddingVertical: SPACING.sm,
-    borderRadius: RADIUS.md,
-    marginRight: SPACING.md,
-    borderWidth: 1,
-    borderColor: COLORS.veryLight,
-  },
-  floorSelectorActive: {
-    backgroundColor: COLORS.primaryAccent,
-    borderColor: COLORS.primaryAccent,
-  },
-  floorSelectorText: {
-    fontSize: 11,
-    fontWeight: '600',
-    color: COLORS.dark,
-  },
-
-  // PATH STEPS
-  pathStep: {
-    flexDirection: 'row',
-    alignItems: 'center',
-    paddingVertical: SPACING.md,
-    paddingHorizontal: SPACING.md,
-    backgroundColor: COLORS.white,
-    borderRadius: RADIUS.md,
-    marginBottom: SPACING.md,
-    borderLeftWidth: 3,
-    borderLeftColor: COLORS.primaryAccent,
-  },
-  pathOrder: {
-    fontSize: 12,
-    fontWeight: '700',
-    color: COLORS.primaryAccent,
-    marginRight: SPACING.md,
-  },
-  pathInfo: {
-    flex: 1,
-  },
-  pathFloor: {
-    fontSize: 12,
-    fontWeight: '600',
-    color: COLORS.dark,
-  },
-  pathTime: {
-    fontSize: 11,
-    color: COLORS.gray,
-    marginTop: SPACING.xs,
-  },
-
-  // ANALYSIS
-  analysisItem: {
-    flexDirection: 'row',
-    justifyContent: 'space-between',
-    paddingVertical: SPACING.md,
-    paddingHorizontal: SPACING.md,
-    backgroundColor: COLORS.white,
-    borderRadius: RADIUS.md,
-    marginBottom: SPACING.md,
-  },
-  analysisFloor: {
-    fontSize: 12,
-    fontWeight: '600',
-    color: COLORS.dark,
-  },
-  analysisTime: {
-    fontSize: 12,
-    fontWeight: '600',
-    color: COLORS.primaryAccent,
-  },
-
-  // STATS
-  statsContainer: {
-    flexDirection: 'row',
-    justifyContent: 'space-between',
-    marginBottom: SPACING.lg,
-    gap: SPACING.md,
-  },
-  statBox: {
-    flex: 1,
-    backgroundColor: COLORS.white,
-    borderRadius: RADIUS.lg,
-    padding: SPACING.md,
-    alignItems: 'center',
-    borderWidth: 1,
-    borderColor: COLORS.veryLight,
-  },
-  statValue: {
-    fontSize: 18,
-    fontWeight: '700',
-    color: COLORS.primaryAccent,
-  },
-  statLabel: {
-    fontSize: 11,
-    color: COLORS.gray,
-    marginTop: SPACING.xs,
-  },
-
-  // SESSION CARDS
-  sessionCard: {
-    backgroundColor: COLORS.white,
-    borderRadius: RADIUS.lg,
-    padding: SPACING.lg,
-    marginBottom: SPACING.md,
-    flexDirection: 'row',
-    justifyContent: 'space-between',
-    alignItems: 'center',
-    borderWidth: 1,
-    borderColor: COLORS.veryLight,
-  },
-  sessionElevator: {
-    fontSize: 13,
-    fontWeight: '700',
-    color: COLORS.primaryAccent,
-  },
-  sessionTime: {
-    fontSize: 11,
-    color: COLORS.gray,
-    marginTop: SPACING.xs,
-  },
-  sessionStats: {
-    fontSize: 11,
-    color: COLORS.gray,
-    marginTop: SPACING.xs,
-  },
-  viewArrow: {
-    fontSize: 18,
-    color: COLORS.gray,
-  },
-
-  // CONTROLS
-  controls: {
-    paddingHorizontal: SPACING.lg,
-    paddingVertical: SPACING.lg,
-    backgroundColor: COLORS.white,
-    borderTopWidth: 1,
-    borderTopColor: COLORS.veryLight,
-  },
-  button: {
-    paddingVertical: SPACING.md,
-    borderRadius: RADIUS.md,
-    alignItems: 'center',
-  },
-  stopButton: {
-    backgroundColor: COLORS.danger,
-  },
-
-  // INSTRUCTIONS
-  instructions: {
-    backgroundColor: COLORS.surface,
-    borderRadius: RADIUS.lg,
-    padding: SPACING.md,
-    marginVertical: SPACING.lg,
-  },
-  instructionsTitle: {
-    fontSize: 12,
-    fontWeight: '700',
-    color: COLORS.dark,
-    marginBottom: SPACING.sm,
-  },
-  instructionText: {
-    fontSize: 11,
-    color: COLORS.gray,
-    marginBottom: SPACING.xs,
-  },
-
-  // EMPTY
-  emptyText: {
-    textAlign: 'center',
-    color: COLORS.gray,
-    fontSize: 13,
-    marginTop: SPACING.lg,
-  },
-  buttonText: {
-    color: COLORS.white,
-    fontSize: 13,
-    fontWeight: '600',
-  },
-});
+// Stylesheets are built once per theme object and reused, so style
+// references stay stable across renders (and across theme switches back).
+const themeStyleCache = new WeakMap();
+
+function getStyles(theme) {
+  let themed = themeStyleCache.get(theme);
+  if (!themed) {
+    themed = makeStyles(theme);
+    themeStyleCache.set(theme, themed);
+  }
+  return themed;
+}
+
+function makeStyles(theme) {
+  return StyleSheet.create({
+    mainContainer: {
+      flex: 1,
+      backgroundColor: theme.background,
+    },
+    container: {
+      flex: 1,
+      backgroundColor: theme.background,
+    },
+
+    // LOGIN
+    loginContainer: {
+      flex: 1,
+      backgroundColor: theme.background,
+    },
+    loginHeader: {
+      paddingVertical: SPACING.xxxl,
+      alignItems: 'center',
+    },
+    logo: {
+      fontSize: 40,
+      fontWeight: '700',
+      color: theme.primary,
+      letterSpacing: 2,
+    },
+    appTitle: {
+      fontSize: 18,
+      fontWeight: '600',
+      color: theme.dark,
+      marginTop: SPACING.md,
+    },
+    appSubtitle: {
+      fontSize: 13,
+      color: theme.gray,
+      marginTop: SPACING.sm,
+    },
+    loginForm: {
+      paddingHorizontal: SPACING.lg,
+      paddingVertical: SPACING.lg,
+    },
+    formLabel: {
+      fontSize: TYPOGRAPHY.label.fontSize,
+      fontWeight: '600',
+      color: theme.dark,
+      marginBottom: SPACING.sm,
+    },
+    input: {
+      borderWidth: 1,
+      borderColor: theme.veryLight,
+      borderRadius: RADIUS.md,
+      paddingHorizontal: SPACING.md,
+      paddingVertical: SPACING.md,
+      fontSize: 14,
+      backgroundColor: theme.white,
+      marginBottom: SPACING.lg,
+    },
+    loginButton: {
+      backgroundColor: theme.primaryAccent,
+      paddingVertical: SPACING.md,
+      borderRadius: RADIUS.md,
+      alignItems: 'center',
+    },
+    loginButtonLoading: {
+      opacity: 0.6,
+    },
+    loginButtonText: {
+      color: theme.white,
+      fontSize: 14,
+      fontWeight: '600',
+    },
+    testAccounts: {
+      marginTop: SPACING.xl,
+      padding: SPACING.md,
+      backgroundColor: theme.surface,
+      borderRadius: RADIUS.lg,
+      borderLeftWidth: 4,
+      borderLeftColor: theme.primaryAccent,
+    },
+    testTitle: {
+      fontSize: 12,
+      fontWeight: '700',
+      color: theme.dark,
+      marginBottom: SPACING.sm,
+    },
+    testAccount: {
+      fontSize: 11,
+      color: theme.gray,
+      marginBottom: SPACING.xs,
+    },
+
+    // HEADER
+    header: {
+      backgroundColor: theme.primary,
+      paddingHorizontal: SPACING.lg,
+      paddingVertical: SPACING.lg,
+      flexDirection: 'row',
+      justifyContent: 'space-between',
+      alignItems: 'center',
+    },
+    headerTitle: {
+      fontSize: 18,
+      fontWeight: '700',
+      color: theme.white,
+    },
+    headerSubtitle: {
+      fontSize: 12,
+      color: 'rgba(255, 255, 255, 0.7)',
+      marginTop: SPACING.xs,
+    },
+    backButton: {
+      color: theme.white,
+      fontSize: 14,
+      fontWeight: '600',
+    },
+    logoutButton: {
+      fontSize: 24,
+    },
+
+    // CONTENT
+    content: {
+      flex: 1,
+      paddingHorizontal: SPACING.lg,
+      paddingVertical: SPACING.lg,
+    },
+    sectionTitle: {
+      fontSize: 16,
+      fontWeight: '700',
+      color: theme.dark,
+      marginBottom: SPACING.md,
+    },
+    chartTitle: {
+      fontSize: 14,
+      fontWeight: '700',
+      color: theme.dark,
+      marginTop: SPACING.lg,
+      marginBottom: SPACING.md,
+    },
+    // Secondary caption line, shared by cards, stats and path steps
+    mutedCaption: {
+      fontSize: TYPOGRAPHY.caption.fontSize,
+      lineHeight: TYPOGRAPHY.caption.lineHeight,
+      color: theme.gray,
+      marginTop: SPACING.xs,
+    },
+
+    // ELEVATOR CARDS
+    elevatorCard: {
+      backgroundColor: theme.white,
+      borderRadius: RADIUS.lg,
+      padding: SPACING.lg,
+      marginBottom: SPACING.md,
+      borderWidth: 1,
+      borderColor: theme.veryLight,
+    },
+    elevatorCardContent: {
+      flexDirection: 'row',
+      justifyContent: 'space-between',
+      alignItems: 'flex-start',
+      marginBottom: SPACING.md,
+    },
+    elevatorName: {
+      fontSize: 14,
+      fontWeight: '700',
+      color: theme.primaryAccent,
+    },
+    elevatorDesc: {
+      fontSize: 13,
+      fontWeight: '600',
+      color: theme.dark,
+      marginTop: SPACING.xs,
+    },
+    statusBadge: {
+      paddingHorizontal: SPACING.md,
+      paddingVertical: SPACING.sm,
+      borderRadius: RADIUS.sm,
+    },
+    statusBadgeActive: {
+      backgroundColor: theme.success,
+    },
+    statusBadgeWarning: {
+      backgroundColor: theme.warning,
+    },
+    statusText: {
+      color: theme.white,
+      fontSize: 11,
+      fontWeight: '600',
+    },
+    startButton: {
+      backgroundColor: theme.primaryAccent,
+      paddingVertical: SPACING.md,
+      borderRadius: RADIUS.md,
+      alignItems: 'center',
+    },
+    startButtonText: {
+      color: theme.white,
+      fontSize: 13,
+      fontWeight: '600',
+    },
+
+    // RECORDING
+    statusCard: {
+      backgroundColor: theme.white,
+      borderRadius: RADIUS.lg,
+      padding: SPACING.xl,
+      marginBottom: SPACING.lg,
+      alignItems: 'center',
+      borderLeftWidth: 4,
+      borderLeftColor: theme.warning,
+    },
+    recordingActive: {
+      backgroundColor: '#fff5f0',
+      borderLeftColor: theme.danger,
+    },
+    statusIcon: {
+      fontSize: 48,
+      marginBottom: SPACING.md,
+    },
+    timer: {
+      fontSize: 32,
+      fontWeight: '700',
+      color: theme.primaryAccent,
+      marginVertical: SPACING.md,
+    },
+    floorDisplay: {
+      fontSize: 13,
+      color: theme.gray,
+    },
+    pointsDisplay: {
+      fontSize: 13,
+      color: theme.gray,
+      marginTop: SPACING.xs,
+    },
+
+    // HEAT MAPS
+    heatmapContainer: {
+      backgroundColor: theme.white,
+      borderRadius: RADIUS.lg,
+      overflow: 'hidden',
+      marginBottom: SPACING.lg,
+    },
+    floorBar: {
+      flexDirection: 'row',
+      alignItems: 'center',
+      paddingVertical: SPACING.md,
+      paddingHorizontal: SPACING.md,
+      borderBottomWidth: 1,
+      borderBottomColor: theme.veryLight,
+    },
+    floorBarActive: {
+      backgroundColor: 'rgba(46, 80, 144, 0.05)',
+    },
+    floorLabel: {
+      fontSize: 11,
+      color: theme.gray,
+      fontWeight: '600',
+      width: 100,
+    },
+    barBackground: {
+      flex: 1,
+      height: 24,
+      backgroundColor: theme.surface,
+      borderRadius: RADIUS.sm,
+      marginHorizontal: SPACING.md,
+      overflow: 'hidden',
+    },
+    barFill: {
+      height: '100%',
+      backgroundColor: theme.primaryAccent,
+      borderRadius: RADIUS.sm,
+    },
+    barFillActive: {
+      backgroundColor: theme.danger,
+    },
+    floorDuration: {
+      fontSize: 11,
+      color: theme.dark,
+      fontWeight: '600',
+      width: 50,
+      textAlign: 'right',
+    },
+
+    // HORIZONTAL HEAT MAP
+    horizontalHeatmapContainer: {
+      backgroundColor: theme.white,
+      borderRadius: RADIUS.lg,
+      padding: SPACING.lg,
+      marginBottom: SPACING.lg,
+    },
+    heatmapSubtitle: {
+      fontSize: 13,
+      fontWeight: '600',
+      color: theme.dark,
+      marginBottom: SPACING.md,
+    },
+    carVisualizer: {
+      alignItems: 'center',
+      marginVertical: SPACING.lg,
+    },
+    carBoundary: {
+      width: CAR_WIDTH,
+      height: CAR_DEPTH,
+      borderWidth: 2,
+      borderColor: theme.primaryAccent,
+      position: 'relative',
+      backgroundColor: theme.surface,
+    },
+    heatmapNote: {
+      fontSize: 11,
+      color: theme.gray,
+      textAlign: 'center',
+    },
+
+    // FLOOR SELECTOR
+    floorSelector: {
+      marginBottom: SPACING.lg,
+    },
+    floorSelectorButton: {
+      backgroundColor: theme.white,
+      paddingHorizontal: SPACING.md,
+      paddingVertical: SPACING.sm,
+      borderRadius: RADIUS.md,
+      marginRight: SPACING.md,
+      borderWidth: 1,
+      borderColor: theme.veryLight,
+    },
+    floorSelectorActive: {
+      backgroundColor: theme.primaryAccent,
+      borderColor: theme.primaryAccent,
+    },
+    floorSelectorText: {
+      fontSize: 11,
+      fontWeight: '600',
+      color: theme.dark,
+    },
+
+    // PATH STEPS
+    pathStep: {
+      flexDirection: 'row',
+      alignItems: 'center',
+      paddingVertical: SPACING.md,
+      paddingHorizontal: SPACING.md,
+      backgroundColor: theme.white,
+      borderRadius: RADIUS.md,
+      marginBottom: SPACING.md,
+      borderLeftWidth: 3,
+      borderLeftColor: theme.primaryAccent,
+    },
+    pathOrder: {
+      fontSize: 12,
+      fontWeight: '700',
+      color: theme.primaryAccent,
+      marginRight: SPACING.md,
+    },
+    pathInfo: {
+      flex: 1,
+    },
+    pathFloor: {
+      fontSize: 12,
+      fontWeight: '600',
+      color: theme.dark,
+    },
+
+    // ANALYSIS
+    analysisItem: {
+      flexDirection: 'row',
+      justifyContent: 'space-between',
+      paddingVertical: SPACING.md,
+      paddingHorizontal: SPACING.md,
+      backgroundColor: theme.white,
+      borderRadius: RADIUS.md,
+      marginBottom: SPACING.md,
+    },
+    analysisFloor: {
+      fontSize: 12,
+      fontWeight: '600',
+      color: theme.dark,
+    },
+    analysisTime: {
+      fontSize: 12,
+      fontWeight: '600',
+      color: theme.primaryAccent,
+    },
+
+    // STATS
+    statsContainer: {
+      flexDirection: 'row',
+      justifyContent: 'space-between',
+      marginBottom: SPACING.lg,
+      gap: SPACING.md,
+    },
+    statBox: {
+      flex: 1,
+      backgroundColor: theme.white,
+      borderRadius: RADIUS.lg,
+      padding: SPACING.md,
+      alignItems: 'center',
+      borderWidth: 1,
+      borderColor: theme.veryLight,
+    },
+    statValue: {
+      fontSize: 18,
+      fontWeight: '700',
+      color: theme.primaryAccent,
+    },
+
+    // SESSION CARDS
+    sessionCard: {
+      backgroundColor: theme.white,
+      borderRadius: RADIUS.lg,
+      padding: SPACING.lg,
+      marginBottom: SPACING.md,
+      flexDirection: 'row',
+      justifyContent: 'space-between',
+      alignItems: 'center',
+    },
+    // Cards are set apart by background contrast instead of a per-card border
+    sessionListArea: {
+      backgroundColor: theme.veryLight,
+    },
+    // Fixed line heights keep the card height constant (see SESSION_ROW_HEIGHT)
+    // Bounded width so long lines truncate instead of pushing the arrow out
+    sessionText: {
+      flex: 1,
+    },
+    sessionElevator: {
+      fontSize: 13,
+      lineHeight: 18,
+      fontWeight: '700',
+      color: theme.primaryAccent,
+    },
+    // mutedCaption with the gap folded into lineHeight, so the line is a fixed height
+    sessionCaption: {
+      fontSize: TYPOGRAPHY.caption.fontSize,
+      lineHeight: TYPOGRAPHY.caption.lineHeight + SPACING.xs,
+      color: theme.gray,
+    },
+    sessionCardPressed: {
+      opacity: 0.7,
+    },
+    viewArrow: {
+      fontSize: 18,
+      color: theme.gray,
+    },
+
+    // CONTROLS
+    controls: {
+      paddingHorizontal: SPACING.lg,
+      paddingVertical: SPACING.lg,
+      backgroundColor: theme.white,
+      borderTopWidth: 1,
+      borderTopColor: theme.veryLight,
+    },
+    button: {
+      paddingVertical: SPACING.md,
+      borderRadius: RADIUS.md,
+      alignItems: 'center',
+    },
+    stopButton: {
+      backgroundColor: theme.danger,
+    },
+
+    // INSTRUCTIONS
+    instructions: {
+      backgroundColor: theme.surface,
+      borderRadius: RADIUS.lg,
+      padding: SPACING.md,
+      marginVertical: SPACING.lg,
+    },
+    // Nested spans ignore margins, so the gaps live in lineHeight
+    instructionsTitle: {
+      fontSize: 12,
+      lineHeight: 16 + SPACING.sm,
+      fontWeight: '700',
+      color: theme.dark,
+    },
+    instructionText: {
+      fontSize: 11,
+      lineHeight: 14 + SPACING.xs,
+      color: theme.gray,
+    },
+
+    // EMPTY
+    emptyText: {
+      textAlign: 'center',
+      color: theme.gray,
+      fontSize: 13,
+      marginTop: SPACING.lg,
+    },
+    buttonText: {
+      color: theme.white,
+      fontSize: 13,
+      fontWeight: '600',
+    },
+  });
+}
+
+const styles = getStyles(COLORS);
+
+// ====================================================================
+// COMPOSED STYLES
+// Built once so renders pass the same style reference every time
+// ====================================================================
+const LOGIN_BUTTON_LOADING_STYLE = StyleSheet.flatten([styles.loginButton, styles.loginButtonLoading]);
+const STATUS_BADGE_ACTIVE_STYLE = StyleSheet.flatten([styles.statusBadge, styles.statusBadgeActive]);
+const STATUS_BADGE_WARNING_STYLE = StyleSheet.flatten([styles.statusBadge, styles.statusBadgeWarning]);
+const STATUS_CARD_RECORDING_STYLE = StyleSheet.flatten([styles.statusCard, styles.recordingActive]);
+const FLOOR_BAR_ACTIVE_STYLE = StyleSheet.flatten([styles.floorBar, styles.floorBarActive]);
+const BAR_FILL_ACTIVE_STYLE = StyleSheet.flatten([styles.barFill, styles.barFillActive]);
+const FLOOR_SELECTOR_ACTIVE_STYLE = StyleSheet.flatten([styles.floorSelectorButton, styles.floorSelectorActive]);
+const BUTTON_STYLES = {
+  start: StyleSheet.flatten([styles.button, styles.startButton]),
+  stop: StyleSheet.flatten([styles.button, styles.stopButton]),
+};
+const ADMIN_CONTENT_STYLE = StyleSheet.flatten([styles.content, styles.sessionListArea]);
+const SESSION_CARD_PRESSED_STYLE = StyleSheet.flatten([styles.sessionCard, styles.sessionCardPressed]);
+
+// ====================================================================
+// STATIC ELEMENTS
+// Same element reference every render, so React skips reconciling them
+// ====================================================================
+const EMPTY_SESSIONS_VIEW = <Text style={styles.emptyText}>No sessions recorded yet</Text>;
+const VIEW_ARROW = <Text style={styles.viewArrow} allowFontScaling={false}>→</Text>;